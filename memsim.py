@@ -1,6 +1,9 @@
 from clockmmu import ClockMMU
 from lrummu import LruMMU
+from pffmmu import PffMMU
+from phasestats import PhaseAnalyzer
 from randmmu import RandMMU
+from wsmmu import WorkingSetMMU
 
 import sys
 
@@ -13,7 +16,7 @@ def main():
     ############################
 
     if (len(sys.argv) < 5):
-        print("Usage: python memsim.py inputfile numberframes replacementmode debugmode")
+        print("Usage: python memsim.py inputfile numberframes replacementmode debugmode [seriesfile [windowsize [tau]]]")
         return
 
     input_file = sys.argv[1]
@@ -24,15 +27,19 @@ def main():
             trace_contents = file.readlines()
     except FileNotFoundError:
         print(f"Input '{input_file}' could not be found")
-        print("Usage: python memsim.py inputfile numberframes replacementmode debugmode")
+        print("Usage: python memsim.py inputfile numberframes replacementmode debugmode [seriesfile [windowsize [tau]]]")
         return
 
     frames = int(sys.argv[2])
-    if frames < 1:
-       printf( "Frame number must be at least 1\n");
-       return
-
     replacement_mode = sys.argv[3]
+    if frames < 1:
+        if replacement_mode == "ws":
+            print("Working set window must be at least 1")
+        elif replacement_mode == "pff":
+            print("PFF fault interval must be at least 1")
+        else:
+            print("Frame number must be at least 1")
+        return
 
     # Setup MMU based on replacement mode
     if replacement_mode == "rand":
@@ -41,8 +48,14 @@ def main():
         mmu = LruMMU(frames)
     elif replacement_mode == "clock":
         mmu = ClockMMU(frames)
+    elif replacement_mode == "ws":
+        # Variable allocation: numberframes is the working-set window tau
+        mmu = WorkingSetMMU(frames)
+    elif replacement_mode == "pff":
+        # Variable allocation: numberframes is the fault-interval threshold
+        mmu = PffMMU(frames)
     else:
-        print("Invalid replacement mode. Valid options are [rand, lru, esc]")
+        print("Invalid replacement mode. Valid options are [rand, lru, clock, ws, pff]")
         return
 
     debug_mode  = sys.argv[4]
@@ -56,38 +69,94 @@ def main():
         print("Invalid debug mode. Valid options are [debug, quiet]")
         return
 
+    # Optional per-window time series
+    series_path = None
+    window = 1000
+    tau = 1000
+    if len(sys.argv) > 5:
+        series_path = sys.argv[5]
+        try:
+            if len(sys.argv) > 6:
+                window = int(sys.argv[6])
+            if len(sys.argv) > 7:
+                tau = int(sys.argv[7])
+        except ValueError:
+            print("Window size and tau must be integers")
+            print("Usage: python memsim.py inputfile numberframes replacementmode debugmode [seriesfile [windowsize [tau]]]")
+            return
+        if window < 1 or tau < 1:
+            print("Window size and tau must be at least 1")
+            return
+
+    # ws and pff report the resident set the MMU actually kept
+    if replacement_mode in ("ws", "pff"):
+        tau = None
+
+    series_file = None
+    analyzer = None
+    if series_path is not None:
+        try:
+            series_file = open(series_path, 'w', newline='')
+        except OSError:
+            print(f"Output '{series_path}' could not be opened")
+            print("Usage: python memsim.py inputfile numberframes replacementmode debugmode [seriesfile [windowsize [tau]]]")
+            return
+        analyzer = PhaseAnalyzer(mmu, series_file, window, tau)
+
     ############################################################
     # Main Loop: Process the addresses from the trace file     #
     ############################################################
 
     no_events = 0
 
-
-    with open(input_file, 'r') as trace_file:
-        for trace_line in trace_file:
-            trace_cmd = trace_line.strip().split(" ")
-            logical_address = int(trace_cmd[0], 16)
-            page_number = logical_address >>  PAGE_OFFSET
-
-
-            # Process read or write
-            if trace_cmd[1] == "R":
-                mmu.read_memory(page_number)
-            elif trace_cmd[1] == "W":
-                mmu.write_memory(page_number)
-            else:
-                print(f"Badly formatted file. Error on line {no_events + 1}")
-                return
-
-            no_events += 1
+    try:
+        with open(input_file, 'r') as trace_file:
+            for trace_line in trace_file:
+                trace_cmd = trace_line.strip().split(" ")
+                try:
+                    logical_address = int(trace_cmd[0], 16)
+                    access = trace_cmd[1]
+                except (ValueError, IndexError):
+                    print(f"Badly formatted file. Error on line {no_events + 1}")
+                    return
+                page_number = logical_address >>  PAGE_OFFSET
+
+
+                # Process read or write
+                if access == "R":
+                    mmu.read_memory(page_number)
+                elif access == "W":
+                    mmu.write_memory(page_number)
+                else:
+                    print(f"Badly formatted file. Error on line {no_events + 1}")
+                    return
+
+                if analyzer is not None:
+                    analyzer.observe(page_number)
+
+                no_events += 1
+
+        if analyzer is not None:
+            analyzer.finish()
+    finally:
+        if series_file is not None:
+            series_file.close()
 
     # TODO: Print results
     # Fixed output (matches expected format):
-    print(f"total memory frames:  {frames}")
+    if replacement_mode == "ws":
+        print(f"working set window:   {frames}")
+    elif replacement_mode == "pff":
+        print(f"pff fault interval:   {frames}")
+    else:
+        print(f"total memory frames:  {frames}")
     print(f"events in trace:      {no_events}")
     print(f"total disk reads:     {mmu.get_total_disk_reads()}")
     print(f"total disk writes:    {mmu.get_total_disk_writes()}")
     print("page fault rate:      {0:.4f}".format(mmu.get_total_page_faults() / no_events))
+    if replacement_mode in ("ws", "pff"):
+        print("avg resident frames:  {0:.4f}".format(mmu.get_average_resident_frames()))
+        print(f"peak resident frames: {mmu.get_peak_resident_frames()}")
 
 if __name__ == "__main__":
     main()
@@ -28,3 +28,12 @@ class MMU:
 
     def get_total_page_faults(self):
         return -1
+
+    def get_resident_frames(self):
+        return -1
+
+    def get_average_resident_frames(self):
+        return -1
+
+    def get_peak_resident_frames(self):
+        return -1
@@ -0,0 +1,149 @@
+from collections import OrderedDict
+
+from mmu import MMU
+
+
+class PffMMU(MMU):
+    """
+    A page-fault-frequency (PFF) variable allocation MMU.
+
+    The resident set is only adjusted when a page fault occurs:
+    - If the time since the previous fault is at most `threshold` references,
+      faults are frequent, so the faulting page is simply added (grow).
+    - Otherwise every page not referenced since the previous fault is released
+      before the faulting page is added (shrink).
+    Dirty pages incur a disk write when they are released.
+
+    Pages are kept in a recency list, so the pages not referenced since the
+    previous fault are exactly a prefix of it. Each page is removed at most once
+    per residency, which keeps the shrink step O(1) amortized per event.
+
+    Public counters:
+      - get_total_page_faults()
+      - get_total_disk_reads()
+      - get_total_disk_writes()
+      - get_average_resident_frames()
+      - get_peak_resident_frames()
+    """
+
+    def __init__(self, threshold: int):
+        # Largest inter-fault interval (in references) that still allows growth
+        self.threshold = int(threshold)
+
+        # Metrics for reporting
+        self._page_faults = 0      # Count of page faults
+        self._disk_reads = 0       # Count of reads (loads) from disk
+        self._disk_writes = 0      # Count of writes (dirty pages released)
+
+        # Resident set: page -> time of last reference, ordered least to most recent
+        self.last_ref = OrderedDict()
+        self.dirty = set()         # Resident pages written since load
+
+        # Virtual time: incremented on every access
+        self.current_time = 0
+        self.last_fault_time = 0
+
+        # Resident set size tracking
+        self._resident_sum = 0     # Sum of resident set sizes over all events
+        self._peak_resident = 0
+
+        # Optional debug printing
+        self.debug = False
+
+    def set_debug(self):
+        """Enable verbose debug printing."""
+        self.debug = True
+
+    def reset_debug(self):
+        """Disable verbose debug printing."""
+        self.debug = False
+
+    def read_memory(self, page_number: int):
+        """Read access to a page."""
+        self._access(page_number, is_write=False)
+
+    def write_memory(self, page_number: int):
+        """Write access to a page (marks it dirty)."""
+        self._access(page_number, is_write=True)
+
+    def get_total_disk_reads(self) -> int:
+        """Return the total number of disk reads (page loads)."""
+        return self._disk_reads
+
+    def get_total_disk_writes(self) -> int:
+        """Return the total number of disk writes (dirty evictions)."""
+        return self._disk_writes
+
+    def get_total_page_faults(self) -> int:
+        """Return the total number of page faults encountered."""
+        return self._page_faults
+
+    def get_resident_frames(self) -> int:
+        """Return the number of frames currently resident."""
+        return len(self.last_ref)
+
+    def get_average_resident_frames(self) -> float:
+        """Return the resident set size averaged over all events."""
+        if self.current_time == 0:
+            return 0.0
+        return self._resident_sum / self.current_time
+
+    def get_peak_resident_frames(self) -> int:
+        """Return the largest resident set size seen."""
+        return self._peak_resident
+
+    def _access(self, page: int, is_write: bool):
+        """
+        Core access path:
+        - If page is resident: refresh its position in the recency list.
+        - Else: page fault -> shrink if faults are infrequent, then load the page.
+        """
+        self.current_time += 1
+
+        if page in self.last_ref:
+            self.last_ref.move_to_end(page)
+            if self.debug:
+                print(f"{'writing' if is_write else 'reading'}   {page:8d}")
+        else:
+            self._page_faults += 1
+            self._disk_reads += 1
+            if self.debug:
+                print(f"Page fault {page:8d}")
+
+            if self.current_time - self.last_fault_time > self.threshold:
+                self._shrink()
+            self.last_fault_time = self.current_time
+
+            if self.debug:
+                print(f"{'writing' if is_write else 'reading'}   {page:8d}")
+
+        self.last_ref[page] = self.current_time
+        if is_write:
+            self.dirty.add(page)
+
+        resident = len(self.last_ref)
+        self._resident_sum += resident
+        if resident > self._peak_resident:
+            self._peak_resident = resident
+
+    def _shrink(self):
+        """
+        Release every page not referenced since the previous fault.
+        The recency list is ordered, so stop at the first page referenced since then.
+        """
+        while self.last_ref:
+            page, when = next(iter(self.last_ref.items()))
+            if when >= self.last_fault_time:
+                break
+            self.last_ref.popitem(last=False)
+            self._release(page)
+
+    def _release(self, page: int):
+        """Release a page's frame, writing it back if dirty."""
+        if page in self.dirty:
+            self.dirty.discard(page)
+            self._disk_writes += 1
+            if self.debug:
+                print(f"Disk write {page:8d}")
+        elif self.debug:
+            print(f"Discard    {page:8d}")
@@ -0,0 +1,131 @@
+from collections import OrderedDict
+import csv
+
+
+class PhaseAnalyzer:
+    """
+    Streaming per-window analysis of a simulation run.
+
+    The trace is cut into consecutive windows of `window` events. For each
+    window one CSV row is written with:
+      - faults:         page faults taken by the MMU in the window
+      - disk_writes:    dirty write-backs performed by the MMU in the window
+      - distinct_pages: number of different pages touched in the window
+      - working_set:    mean working-set size over the window
+      - distance:       signature distance to the previous window
+      - phase:          phase id, incremented on each detected phase change
+
+    Phase detection compares fixed-size working-set signatures of consecutive
+    windows: each touched page sets one bit of a `signature_bits` bit vector,
+    and the relative distance |A xor B| / |A or B| above `threshold` marks a
+    phase change. Memory is bounded by the window, tau and the signature size,
+    not by the trace length.
+
+    With `tau` set, the working set is W(t, tau) tracked here, which suits the
+    fixed-frame MMUs. With `tau` left as None the MMU's own resident set
+    (get_resident_frames()) is sampled instead, so ws and pff runs report the
+    same working set the policy actually kept.
+    """
+
+    COLUMNS = ["window", "first_event", "events", "faults", "disk_writes",
+               "distinct_pages", "working_set", "distance", "phase"]
+
+    def __init__(self, mmu, out_file, window=1000, tau=None,
+                 signature_bits=1024, threshold=0.5):
+        self.mmu = mmu
+        self.window = int(window)
+        self.tau = int(tau) if tau is not None else None
+        self.signature_bits = int(signature_bits)
+        self.threshold = float(threshold)
+
+        self._writer = csv.writer(out_file)
+        self._writer.writerow(self.COLUMNS)
+
+        # Global position in the trace
+        self.events = 0
+
+        # Working set W(t, tau): page -> time of last reference, least recent first.
+        # Unused when the MMU's resident set is sampled instead.
+        self._last_ref = OrderedDict()
+
+        # Per-window state, reset at each window boundary
+        self._window_index = 0
+        self._window_start = 0
+        self._window_pages = set()
+        self._ws_sum = 0
+        self._signature = 0
+        self._faults_at_start = 0
+        self._writes_at_start = 0
+
+        # Phase tracking
+        self._prev_signature = None
+        self.phase = 0
+
+    def observe(self, page_number):
+        """Record one trace event; call after the MMU has processed it."""
+        self.events += 1
+
+        if self.tau is None:
+            self._ws_sum += self.mmu.get_resident_frames()
+        else:
+            self._ws_sum += self._working_set(page_number)
+
+        self._window_pages.add(page_number)
+        self._signature |= 1 << (page_number % self.signature_bits)
+
+        if self.events - self._window_start == self.window:
+            self._emit()
+
+    def _working_set(self, page_number):
+        """Maintain W(t, tau), O(1) amortized per event, and return its size."""
+        self._last_ref[page_number] = self.events
+        self._last_ref.move_to_end(page_number)
+        horizon = self.events - self.tau
+        while True:
+            page, when = next(iter(self._last_ref.items()))
+            if when > horizon:
+                break
+            self._last_ref.popitem(last=False)
+        return len(self._last_ref)
+
+    def finish(self):
+        """Flush the last, possibly partial, window."""
+        if self.events > self._window_start:
+            self._emit()
+
+    def _emit(self):
+        """Write the row for the current window and start the next one."""
+        events = self.events - self._window_start
+        faults = self.mmu.get_total_page_faults()
+        writes = self.mmu.get_total_disk_writes()
+
+        if self._prev_signature is None:
+            distance = 0.0
+        else:
+            union = bin(self._signature | self._prev_signature).count("1")
+            diff = bin(self._signature ^ self._prev_signature).count("1")
+            distance = diff / union if union else 0.0
+            # A short trailing window is not compared as a new phase
+            if distance > self.threshold and events == self.window:
+                self.phase += 1
+
+        self._writer.writerow([
+            self._window_index,
+            self._window_start,
+            events,
+            faults - self._faults_at_start,
+            writes - self._writes_at_start,
+            len(self._window_pages),
+            "{0:.2f}".format(self._ws_sum / events),
+            "{0:.4f}".format(distance),
+            self.phase,
+        ])
+
+        self._prev_signature = self._signature
+        self._window_index += 1
+        self._window_start = self.events
+        self._window_pages = set()
+        self._ws_sum = 0
+        self._signature = 0
+        self._faults_at_start = faults
+        self._writes_at_start = writes
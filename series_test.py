@@ -0,0 +1,121 @@
+"""
+Test script for the per-window time series written by memsim.py
+Checks the CSV against an expected file, that the per-window counts add up
+to the run totals, and that a trace with a clear phase shift changes phase
+"""
+
+import csv
+import subprocess
+import sys
+import os
+
+SERIES_FILE = 'series_test_output.csv'
+
+def run_series(trace_file, parameter, mode, window, tau=None):
+    """Run memsim.py with a series file; return (totals, rows) or None on error"""
+    args = [sys.executable, 'memsim.py', trace_file, str(parameter), mode, 'quiet',
+            SERIES_FILE, str(window)]
+    if tau is not None:
+        args.append(str(tau))
+
+    result = subprocess.run(args, capture_output=True, text=True, timeout=30)
+    if result.returncode != 0:
+        print(f"ERROR: {result.stderr}")
+        return None
+
+    # Parse the "label:   value" lines of the summary
+    totals = {}
+    for line in result.stdout.strip().split('\n'):
+        label, value = line.split(':', 1)
+        totals[label] = value.strip()
+
+    with open(SERIES_FILE, 'r', newline='') as f:
+        rows = list(csv.DictReader(f))
+    return totals, rows
+
+def check_expected(trace_file, parameter, mode, window, tau, expected_file):
+    """Compare the series CSV with a checked-in expected file"""
+    print(f"\n=== Series {trace_file} {mode} {parameter}, window {window}, tau {tau} ===")
+    if run_series(trace_file, parameter, mode, window, tau) is None:
+        return False
+
+    with open(SERIES_FILE, 'r') as f:
+        output = f.read().strip()
+    with open(expected_file, 'r') as f:
+        expected = f.read().strip()
+
+    if output == expected:
+        print("PASS: Series matches expected")
+        return True
+
+    print("FAIL: Series doesn't match")
+    for i, (actual, expect) in enumerate(zip(output.split('\n'), expected.split('\n'))):
+        if actual != expect:
+            print(f"  Line {i+1}: Got '{actual}' | Expected '{expect}'")
+    return False
+
+def check_totals(trace_file, parameter, mode, window):
+    """Per-window events, faults and disk writes must add up to the run totals"""
+    print(f"\n=== Totals {trace_file} {mode} {parameter}, window {window} ===")
+    run = run_series(trace_file, parameter, mode, window)
+    if run is None:
+        return False
+    totals, rows = run
+
+    ok = True
+    for column, label in [('events', 'events in trace'),
+                          ('faults', 'total disk reads'),
+                          ('disk_writes', 'total disk writes')]:
+        summed = sum(int(row[column]) for row in rows)
+        if summed != int(totals[label]):
+            print(f"FAIL: sum of {column} is {summed}, {label} is {totals[label]}")
+            ok = False
+
+    if ok:
+        print("PASS: Window counts add up to run totals")
+    return ok
+
+def check_phase_shift(trace_file, window):
+    """A trace that switches to a disjoint set of pages must change phase"""
+    print(f"\n=== Phase shift {trace_file}, window {window} ===")
+    run = run_series(trace_file, 4, 'lru', window)
+    if run is None:
+        return False
+    _, rows = run
+
+    phases = [int(row['phase']) for row in rows]
+    if phases[0] == 0 and phases[-1] > phases[0]:
+        print(f"PASS: Phase changed {phases}")
+        return True
+
+    print(f"FAIL: No phase change detected {phases}")
+    return False
+
+def main():
+    print("Per-Window Series Tester")
+    print("=" * 50)
+
+    results = []
+
+    if os.path.exists('trace3-4frames-clock-series.csv'):
+        results.append(check_expected('trace3', 4, 'clock', 20, 10,
+                                      'trace3-4frames-clock-series.csv'))
+
+    for parameter, mode in [(4, 'lru'), (4, 'clock'), (8, 'ws'), (8, 'pff')]:
+        results.append(check_totals('trace3', parameter, mode, 20))
+
+    if os.path.exists('trace_phase'):
+        results.append(check_phase_shift('trace_phase', 100))
+
+    if os.path.exists(SERIES_FILE):
+        os.remove(SERIES_FILE)
+
+    passed = sum(results)
+    print(f"\n=== Series Test Summary ===")
+    print(f"Passed: {passed}/{len(results)}")
+
+    if passed != len(results) or not results:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
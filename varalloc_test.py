@@ -0,0 +1,72 @@
+"""
+Test script for the variable allocation modes (ws and pff)
+Runs memsim.py and compares the output with the expected files
+"""
+
+import subprocess
+import sys
+import os
+
+def check_mode(trace_file, parameter, mode, expected_file):
+    """Run memsim.py in a variable allocation mode and compare with expected output"""
+    print(f"\n=== Testing {trace_file} with {mode} parameter {parameter} ===")
+
+    try:
+        result = subprocess.run([
+            sys.executable, 'memsim.py',
+            trace_file, str(parameter), mode, 'quiet'
+        ], capture_output=True, text=True, timeout=30)
+
+        if result.returncode != 0:
+            print(f"ERROR: {result.stderr}")
+            return False
+
+        output = result.stdout.strip()
+        with open(expected_file, 'r') as f:
+            expected = f.read().strip()
+
+        if output == expected:
+            print("PASS: Output matches expected")
+            return True
+
+        print("FAIL: Output doesn't match")
+        for i, (actual, expect) in enumerate(zip(output.split('\n'), expected.split('\n'))):
+            if actual != expect:
+                print(f"  Line {i+1}: Got '{actual}' | Expected '{expect}'")
+        return False
+
+    except subprocess.TimeoutExpired:
+        print("FAIL: Test timed out!")
+        return False
+    except Exception as e:
+        print(f"FAIL: Exception occurred: {e}")
+        return False
+
+def main():
+    print("Variable Allocation (ws/pff) Tester")
+    print("=" * 50)
+
+    tests = [
+        ('trace3', 8, 'ws', 'trace3-8frames-ws'),
+        ('trace3', 8, 'pff', 'trace3-8frames-pff'),
+    ]
+
+    passed = 0
+    total = 0
+
+    for trace_file, parameter, mode, expected_file in tests:
+        if os.path.exists(trace_file) and os.path.exists(expected_file):
+            total += 1
+            if check_mode(trace_file, parameter, mode, expected_file):
+                passed += 1
+        else:
+            print(f"Skipping {trace_file} {mode} - file not found")
+
+    print(f"\n=== Variable Allocation Test Summary ===")
+    print(f"Passed: {passed}/{total}")
+
+    if passed != total or total == 0:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()